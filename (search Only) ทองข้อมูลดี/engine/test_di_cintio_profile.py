@@ -0,0 +1,45 @@
+"""
+DC14 Enclosed Mass Validation
+=============================
+Checks dc14_enclosed_mass against adaptive quadrature and at r = 0.
+"""
+
+import os
+import sys
+
+import numpy as np
+from scipy import integrate
+
+# Path setup
+sys.path.insert(0, os.path.dirname(__file__))
+
+from di_cintio_profile import dc14_concentration, dc14_density, dc14_enclosed_mass
+
+M_STAR, M_HALO = 2e8, 1e11
+C = dc14_concentration(M_HALO)
+
+
+def test_enclosed_mass_matches_quad():
+    for r in (0.5, 2.0, 10.0):
+        ref, _ = integrate.quad(
+            lambda x: 4 * np.pi * x**2 * dc14_density(x, M_HALO, C, M_STAR), r * 1e-6, r
+        )
+        assert abs(dc14_enclosed_mass(r, M_HALO, C, M_STAR) / ref - 1) < 1e-5
+
+
+def test_enclosed_mass_at_zero_radius():
+    assert dc14_enclosed_mass(0.0, M_HALO, C, M_STAR) == 0.0
+
+    r = np.array([0.0, 1.0, 10.0])
+    M_enc = dc14_enclosed_mass(r, M_HALO, C, M_STAR)
+    assert M_enc.shape == r.shape
+    assert M_enc[0] == 0.0
+    np.testing.assert_allclose(
+        M_enc[1:], [dc14_enclosed_mass(x, M_HALO, C, M_STAR) for x in r[1:]], rtol=1e-12
+    )
+
+
+if __name__ == "__main__":
+    test_enclosed_mass_matches_quad()
+    test_enclosed_mass_at_zero_radius()
+    print("✅ DC14 enclosed mass checks passed")
@@ -10,6 +10,90 @@
 import numpy as np
 from typing import Callable, Tuple, Optional
 import time
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy as cp
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _periodic_neighbours(shape: Tuple[int, ...]) -> Tuple[np.ndarray, ...]:
+    """
+    Index tables (minus, plus) per axis for periodic wrap, built once per grid
+    shape so the stencil kernels look neighbours up instead of computing modulo.
+    """
+    tables = []
+    for n in shape:
+        idx = np.arange(n)
+        tables += [np.roll(idx, 1), np.roll(idx, -1)]
+    return tuple(tables)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(inline="always")
+    def _laplacian_at(field, i, j, k, nbr, dx, dy, dz):
+        """Periodic 7-point Laplacian at one cell (same op order as the np.roll version)."""
+        xm, xp, ym, yp, zm, zp = nbr
+        c = 2 * field[i, j, k]
+        return (
+            (field[xm[i], j, k] - c + field[xp[i], j, k]) / dx**2
+            + (field[i, ym[j], k] - c + field[i, yp[j], k]) / dy**2
+            + (field[i, j, zm[k]] - c + field[i, j, zp[k]]) / dz**2
+        )
+
+    @njit(parallel=True, cache=True)
+    def _laplacian_3d_kernel(field, out, nbr, dx, dy, dz):
+        """Laplacian of the whole field in one pass."""
+        Nx, Ny, Nz = field.shape
+        for i in prange(Nx):
+            for j in range(Ny):
+                for k in range(Nz):
+                    out[i, j, k] = _laplacian_at(field, i, j, k, nbr, dx, dy, dz)
+
+    @njit(parallel=True, cache=True)
+    def _evolve_step_kernel(C, I, mu, C_new, I_new, c1, c3, s, kappa, beta, dt_M, evolve_I, nbr, d):
+        """
+        One fused evolve_step: two passes instead of ~20 NumPy temporaries.
+
+        Pass 1 writes μ = c1·C + c3·C³ + s - κ∇²C + β·I into mu.
+        Pass 2 needs μ at the neighbours, so it runs after pass 1 and writes
+        the clamped C + dt·M·∇²μ and I - dt·M·(β·C + I).
+        """
+        Nx, Ny, Nz = C.shape
+        dx, dy, dz = d
+        for i in prange(Nx):
+            for j in range(Ny):
+                for k in range(Nz):
+                    c = C[i, j, k]
+                    mu[i, j, k] = (
+                        c1 * c
+                        + c3 * c**3
+                        + s
+                        - kappa * _laplacian_at(C, i, j, k, nbr, dx, dy, dz)
+                        + beta * I[i, j, k]
+                    )
+        for i in prange(Nx):
+            for j in range(Ny):
+                for k in range(Nz):
+                    c = C[i, j, k] + dt_M * _laplacian_at(mu, i, j, k, nbr, dx, dy, dz)
+                    C_new[i, j, k] = min(max(c, -10.0), 10.0)
+                    if evolve_I:
+                        v = I[i, j, k] - dt_M * (beta * C[i, j, k] + 1.0 * I[i, j, k])
+                        I_new[i, j, k] = min(max(v, -10.0), 10.0)
+                    else:
+                        I_new[i, j, k] = min(max(I[i, j, k], -10.0), 10.0)
 
 
 class UET4DSolver:
@@ -36,6 +120,8 @@ class UET4DSolver:
         kappa: float = 0.5,
         beta: float = 1.0,
         mobility: float = 1.0,
+        dtype=np.float64,
+        use_gpu: bool = False,
     ):
         """
         Initialize 4D solver.
@@ -54,13 +140,24 @@ class UET4DSolver:
             C-I coupling strength
         mobility : float
             Cahn-Hilliard mobility coefficient
+        dtype : numpy dtype
+            Field precision. np.float32 halves memory traffic for large or
+            qualitative runs; energies are always accumulated in float64.
+        use_gpu : bool
+            Keep the fields on the GPU (requires CuPy). Worth it for large
+            grids or parameter sweeps; run() still returns NumPy arrays.
         """
+        if use_gpu and not CUPY_AVAILABLE:
+            raise ImportError("use_gpu=True requires CuPy (pip install cupy)")
+        self.xp = cp if use_gpu else np
+
         self.Nx, self.Ny, self.Nz = Nx, Ny, Nz
         self.Lx, self.Ly, self.Lz = Lx, Ly, Lz
         self.dt = dt
         self.kappa = kappa
         self.beta = beta
         self.M = mobility
+        self.dtype = np.dtype(dtype)
 
         # SAFETY: Clamp stability parameters
         if self.dt > 0.001:
@@ -81,27 +178,36 @@ class UET4DSolver:
         self.history = {"t": [], "energy": [], "C_mean": [], "I_mean": []}
 
         print(f"✅ UET 4D Solver initialized: {Nx}×{Ny}×{Nz} grid")
-        print(f"   Memory usage: ~{(Nx*Ny*Nz*8*2)/1e6:.1f} MB for C+I fields")
+        print(f"   Memory usage: ~{(Nx*Ny*Nz*self.dtype.itemsize*2)/1e6:.1f} MB for C+I fields")
 
     def laplacian_3d(self, field: np.ndarray) -> np.ndarray:
         """
         Compute 3D Laplacian using finite differences.
         Uses periodic boundary conditions.
         """
-        lap = np.zeros_like(field)
+        xp = self.xp
+        if NUMBA_AVAILABLE and xp is np and field.ndim == 3 and field.dtype.kind == "f":
+            # Fused stencil: no np.roll copies or temporaries
+            lap = np.empty_like(field)
+            nbr = _periodic_neighbours(field.shape)
+            _laplacian_3d_kernel(field, lap, nbr, self.dx, self.dy, self.dz)
+            return lap
+
+        lap = xp.zeros_like(field)
 
         # Second derivatives in each direction
-        lap += (np.roll(field, 1, axis=0) - 2 * field + np.roll(field, -1, axis=0)) / self.dx**2
-        lap += (np.roll(field, 1, axis=1) - 2 * field + np.roll(field, -1, axis=1)) / self.dy**2
-        lap += (np.roll(field, 1, axis=2) - 2 * field + np.roll(field, -1, axis=2)) / self.dz**2
+        lap += (xp.roll(field, 1, axis=0) - 2 * field + xp.roll(field, -1, axis=0)) / self.dx**2
+        lap += (xp.roll(field, 1, axis=1) - 2 * field + xp.roll(field, -1, axis=1)) / self.dy**2
+        lap += (xp.roll(field, 1, axis=2) - 2 * field + xp.roll(field, -1, axis=2)) / self.dz**2
 
         return lap
 
     def gradient_3d(self, field: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Compute 3D gradient using central differences."""
-        grad_x = (np.roll(field, -1, axis=0) - np.roll(field, 1, axis=0)) / (2 * self.dx)
-        grad_y = (np.roll(field, -1, axis=1) - np.roll(field, 1, axis=1)) / (2 * self.dy)
-        grad_z = (np.roll(field, -1, axis=2) - np.roll(field, 1, axis=2)) / (2 * self.dz)
+        xp = self.xp
+        grad_x = (xp.roll(field, -1, axis=0) - xp.roll(field, 1, axis=0)) / (2 * self.dx)
+        grad_y = (xp.roll(field, -1, axis=1) - xp.roll(field, 1, axis=1)) / (2 * self.dy)
+        grad_z = (xp.roll(field, -1, axis=2) - xp.roll(field, 1, axis=2)) / (2 * self.dz)
         return grad_x, grad_y, grad_z
 
     def potential_derivative(
@@ -184,7 +290,7 @@ class UET4DSolver:
         # Added 0.5 * I^2 term (Vacuum Stiffness)
         energy_density = V + 0.5 * self.kappa * grad_sq + coupling + 0.5 * (I**2)
         dV = self.dx * self.dy * self.dz
-        return np.sum(energy_density) * dV
+        return float(self.xp.sum(energy_density, dtype=np.float64)) * dV
 
     def evolve_step(
         self,
@@ -197,6 +303,23 @@ class UET4DSolver:
         evolve_I: bool = True,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Evolve C and I by one time step."""
+        xp = self.xp
+        fused = NUMBA_AVAILABLE and xp is np and C.ndim == 3
+        if fused and C.dtype.kind == "f" and C.dtype == I.dtype:
+            # dV/dC = c1·C + c3·C³ + s for every supported potential
+            if potential_type == "mexican_hat":
+                c1, c3, s = -2 * a, 4 * delta, 0.0
+            else:
+                c1, c3 = 2 * a, 4 * delta
+                s = s if potential_type == "quartic" else 0.0
+            mu = np.empty_like(C)
+            C_new = np.empty_like(C)
+            I_new = np.empty_like(I)
+            params = (c1, c3, s, self.kappa, self.beta, self.dt * self.M, evolve_I)
+            nbr = _periodic_neighbours(C.shape)
+            _evolve_step_kernel(C, I, mu, C_new, I_new, *params, nbr, (self.dx, self.dy, self.dz))
+            return C_new, I_new
+
         mu_C = self.chemical_potential(C, I, potential_type, a, delta, s)
         C_new = C + self.dt * self.M * self.laplacian_3d(mu_C)
 
@@ -210,11 +333,11 @@ class UET4DSolver:
             # No laplacian here -> Much more stable
             I_new = I - self.dt * self.M * mu_I
         else:
-            I_new = I
+            I_new = I.copy()
 
-        # Standard Clamping (Safety)
-        C_new = np.clip(C_new, -10.0, 10.0)
-        I_new = np.clip(I_new, -10.0, 10.0)
+        # Standard Clamping (Safety), in place on the fresh arrays
+        xp.clip(C_new, -10.0, 10.0, out=C_new)
+        xp.clip(I_new, -10.0, 10.0, out=I_new)
 
         return C_new, I_new
 
@@ -250,7 +373,7 @@ class UET4DSolver:
             C0 = core_density / ((R / radius) * (1 + R / radius) ** 2 + 0.1)
             I0 = halo_density / ((R / radius) * (1 + R / radius) ** 2 + 0.1)
 
-        return C0, I0
+        return C0.astype(self.dtype, copy=False), I0.astype(self.dtype, copy=False)
 
     def run(
         self,
@@ -268,12 +391,17 @@ class UET4DSolver:
         """
         Run full 4D simulation.
 
-        Returns final C, I, and history dictionary.
+        Returns final C, I, and history dictionary (arrays, one entry
+        per saved step).
         """
-        C = C0.copy()
-        I = I0.copy()
+        xp = self.xp
+        # Upload once; the whole loop then stays on the solver's device
+        C = xp.array(C0, dtype=self.dtype)
+        I = xp.array(I0, dtype=self.dtype)
 
-        self.history = {"t": [], "energy": [], "C_mean": [], "I_mean": []}
+        # One slot per saved step, filled in place
+        n_saves = len(range(0, n_steps, save_interval))
+        self.history = {key: np.empty(n_saves) for key in ("t", "energy", "C_mean", "I_mean")}
 
         start_time = time.time()
 
@@ -283,26 +411,35 @@ class UET4DSolver:
 
             # Record history
             if step % save_interval == 0:
+                n = step // save_interval
                 t = step * self.dt
                 E = self.compute_energy(C, I, potential_type, a, delta, s)
 
-                self.history["t"].append(t)
-                self.history["energy"].append(E)
-                self.history["C_mean"].append(np.mean(C))
-                self.history["I_mean"].append(np.mean(I))
+                self.history["t"][n] = t
+                self.history["energy"][n] = E
+                self.history["C_mean"][n] = C_mean = float(xp.mean(C))
+                self.history["I_mean"][n] = float(xp.mean(I))
 
                 if verbose and step % (save_interval * 10) == 0:
-                    print(f"   Step {step:5d}: t={t:.2f}, E={E:.4f}, <C>={np.mean(C):.4f}")
+                    print(f"   Step {step:5d}: t={t:.2f}, E={E:.4f}, <C>={C_mean:.4f}")
 
         elapsed = time.time() - start_time
         if verbose:
             print(f"✅ Simulation complete in {elapsed:.1f}s")
 
+        if xp is not np:
+            C, I = cp.asnumpy(C), cp.asnumpy(I)
         return C, I, self.history
 
 
 def create_initial_condition_3d(
-    Nx: int, Ny: int, Nz: int, type: str = "random", amplitude: float = 0.1, seed: int = 42
+    Nx: int,
+    Ny: int,
+    Nz: int,
+    type: str = "random",
+    amplitude: float = 0.1,
+    seed: int = 42,
+    dtype=np.float64,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Create initial conditions for 4D simulation.
@@ -311,12 +448,23 @@ def create_initial_condition_3d(
     - random: Random fluctuations
     - gaussian: Gaussian blob
     - plane_wave: Sinusoidal wave
+
+    Grids are cached per argument set, so sweeps over solver parameters build
+    each base grid once; every call returns its own writable copy.
     """
-    np.random.seed(seed)
+    C0, I0 = _create_initial_condition_3d_cached(Nx, Ny, Nz, type, amplitude, seed, dtype)
+    return C0.copy(), I0.copy()
+
+
+@lru_cache(maxsize=4)
+def _create_initial_condition_3d_cached(Nx, Ny, Nz, type, amplitude, seed, dtype):
+    """Build (C0, I0) once per argument set; read-only since callers share them."""
+    # Local generator: same stream as np.random.seed(seed), no global side effect
+    rng = np.random.RandomState(seed)
 
     if type == "random":
-        C0 = amplitude * (np.random.rand(Nx, Ny, Nz) - 0.5)
-        I0 = amplitude * (np.random.rand(Nx, Ny, Nz) - 0.5)
+        C0 = amplitude * (rng.rand(Nx, Ny, Nz) - 0.5)
+        I0 = amplitude * (rng.rand(Nx, Ny, Nz) - 0.5)
 
     elif type == "gaussian":
         x = np.linspace(-1, 1, Nx)
@@ -340,6 +488,10 @@ def create_initial_condition_3d(
         C0 = np.zeros((Nx, Ny, Nz))
         I0 = np.zeros((Nx, Ny, Nz))
 
+    C0 = C0.astype(dtype, copy=False)
+    I0 = I0.astype(dtype, copy=False)
+    C0.flags.writeable = False
+    I0.flags.writeable = False
     return C0, I0
 
 
@@ -0,0 +1,27 @@
+"""
+Shared path lookup for UET topic scripts.
+
+Scripts live at research_uet/topics/<topic>/Code/<name>/ and run as plain
+files, so the repository root is not importable until they add it:
+
+    try:
+        from research_uet._paths import research_root, topic_dir
+    except ImportError:  # run as a plain script: put the repository root on sys.path
+        sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+        from research_uet._paths import research_root, topic_dir
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def research_root() -> Path:
+    """The research_uet directory."""
+    return Path(__file__).resolve().parent
+
+
+def topic_dir(script: str) -> Path:
+    """research_uet/topics/<topic> for a script anywhere under that topic."""
+    topics = research_root() / "topics"
+    return topics / Path(script).resolve().relative_to(topics).parts[0]
@@ -0,0 +1,25 @@
+"""
+Memoized CSV loading for UET data tests.
+
+Repeated run_test() calls in one process (parameter sweeps, notebooks)
+re-read the same data files; this keeps one parsed copy per file version.
+
+Usage:
+    from research_uet.core.csv_cache import read_csv
+    df = read_csv(path, comment="#")
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+
+@lru_cache(maxsize=128)
+def _read_csv_cached(path, mtime, **kwargs):
+    return pd.read_csv(path, **kwargs)
+
+
+def read_csv(path, **kwargs) -> pd.DataFrame:
+    """pd.read_csv memoized on (path, mtime); returns a copy the caller may modify."""
+    return _read_csv_cached(path, os.path.getmtime(path), **kwargs).copy()
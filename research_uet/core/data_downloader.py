@@ -18,6 +18,8 @@ import json
 from pathlib import Path
 from typing import Dict, Optional
 
+from .http_retry import call_with_retry
+
 
 class DataDownloader:
     """Download and verify data files with checksums."""
@@ -49,16 +51,25 @@ class DataDownloader:
         actual = hashlib.sha256(filepath.read_bytes()).hexdigest()
         return actual.lower() == expected.lower()
 
-    def download_file(self, url: str, filepath: Path) -> bool:
-        """Download file from URL."""
+    def download_file(self, url: str, filepath: Path, attempts: int = 4) -> bool:
+        """Download file from URL, retrying transient failures with backoff."""
+        print(f"  Downloading from {url[:50]}...")
         try:
-            print(f"  Downloading from {url[:50]}...")
-            urllib.request.urlretrieve(url, filepath)
+            call_with_retry(self._retrieve, url, filepath, attempts=attempts)
             return True
         except Exception as e:
             print(f"  ❌ Download failed: {e}")
             return False
 
+    @staticmethod
+    def _retrieve(url: str, filepath: Path):
+        """urlretrieve that removes a partial file if the transfer fails."""
+        try:
+            urllib.request.urlretrieve(url, filepath)
+        except BaseException:
+            filepath.unlink(missing_ok=True)
+            raise
+
     def download_and_verify(self, filename: str) -> bool:
         """Download and verify a single file."""
         if filename not in self.sources:
@@ -0,0 +1,44 @@
+"""
+Retry helper for UET data downloads.
+
+One backoff policy shared by every fetcher, so transient failures
+(rate limits, 5xx, dropped connections, read timeouts) are handled alike.
+
+Usage:
+    from research_uet.core.http_retry import call_with_retry
+    response = call_with_retry(urllib.request.urlopen, req, timeout=10)
+"""
+
+import http.client
+import time
+import urllib.error
+from typing import Any, Callable
+
+# Transient HTTP statuses worth retrying; anything else (e.g. 404) fails at once
+RETRY_CODES = (429, 500, 502, 503, 504)
+
+
+def call_with_retry(
+    fn: Callable[..., Any], *args, attempts: int = 4, backoff: float = 0.5, **kwargs
+) -> Any:
+    """
+    Call fn(*args, **kwargs), retrying transient failures with exponential backoff.
+
+    HTTPError is retried only for RETRY_CODES (honouring a numeric Retry-After);
+    other URLErrors, ConnectionError (reset/refused), TimeoutError and truncated
+    bodies (IncompleteRead) are always retried. Anything else, such as a local
+    FileNotFoundError or PermissionError, fails at once, as does the last retry.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except urllib.error.HTTPError as e:
+            if e.code not in RETRY_CODES or attempt == attempts - 1:
+                raise
+            retry_after = e.headers.get("Retry-After", "") if e.headers else ""
+            delay = float(retry_after) if retry_after.isdigit() else backoff * 2**attempt
+        except (urllib.error.URLError, ConnectionError, TimeoutError, http.client.IncompleteRead):
+            if attempt == attempts - 1:
+                raise
+            delay = backoff * 2**attempt
+        time.sleep(delay)
@@ -12,6 +12,8 @@ Usage:
 """
 
 import hashlib
+import importlib.metadata
+import importlib.util
 import json
 import random
 import sys
@@ -41,23 +43,19 @@ def lock_all_seeds(seed: int = UET_SEED) -> None:
     random.seed(seed)
     np.random.seed(seed)
 
-    # PyTorch if available
-    try:
+    # PyTorch if available (find_spec probes without importing)
+    if importlib.util.find_spec("torch") is not None:
         import torch
 
         torch.manual_seed(seed)
         if torch.cuda.is_available():
             torch.cuda.manual_seed_all(seed)
-    except ImportError:
-        pass
 
     # TensorFlow if available
-    try:
+    if importlib.util.find_spec("tensorflow") is not None:
         import tensorflow as tf
 
         tf.random.set_seed(seed)
-    except ImportError:
-        pass
 
 
 def hash_dataset(data: Union[np.ndarray, bytes, str]) -> str:
@@ -126,12 +124,10 @@ def generate_artifact(
         "results": results,
     }
 
-    # Add optional dependencies
+    # Add optional dependencies (read from package metadata, no import)
     try:
-        import scipy
-
-        artifact["scipy_version"] = scipy.__version__
-    except ImportError:
+        artifact["scipy_version"] = importlib.metadata.version("scipy")
+    except importlib.metadata.PackageNotFoundError:
         pass
 
     return artifact
@@ -1,4 +1,7 @@
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # Non-interactive backend
 import matplotlib.pyplot as plt
 
 # Data
@@ -16,15 +16,71 @@ APIs Used (free, no auth required for some):
 """
 
 import numpy as np
+import gzip
 import json
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from datetime import datetime
 import urllib.request
 import urllib.error
 
+try:
+    from research_uet._paths import research_root
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import research_root
+
+from research_uet.core.http_retry import call_with_retry
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import urllib3
+
+    # Keep-alive pool: repeated calls to one API host (e.g. the weather
+    # grid) reuse the TCP/TLS connection instead of a new handshake each.
+    # urllib3's own retries are off; call_with_retry handles transient failures.
+    HTTP_POOL = urllib3.PoolManager(
+        maxsize=4,
+        headers={"User-Agent": "UET-Research/1.0", "Accept-Encoding": "gzip"},
+        retries=urllib3.Retry(total=None, connect=0, read=0, other=0, redirect=5),
+    )
+except ImportError:
+    HTTP_POOL = None
+
+
+def _get(url: str, timeout: int) -> bytes:
+    """One GET attempt; failures surface as urllib errors for call_with_retry."""
+    if HTTP_POOL is not None:
+        try:
+            response = HTTP_POOL.request("GET", url, timeout=timeout)
+        except urllib3.exceptions.HTTPError as e:
+            raise urllib.error.URLError(e) from e
+        if response.status != 200:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        return response.data
+
+    # urllib does not ask for compression on its own; JSON compresses well
+    req = urllib.request.Request(
+        url, headers={"User-Agent": "UET-Research/1.0", "Accept-Encoding": "gzip"}
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        body = response.read()
+        if response.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
 
 @dataclass
 class FluidDataPoint:
@@ -49,16 +105,13 @@ class RealTimeDataFetcher:
         self.cache_dir = cache_dir or Path(__file__).parent.parent / "Data" / "realtime"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def fetch_url(self, url: str, timeout: int = 10) -> Optional[dict]:
+    def fetch_url(self, url: str, timeout: int = 10, log: Callable = print) -> Optional[dict]:
         """Fetch JSON from URL."""
         try:
-            req = urllib.request.Request(
-                url, headers={"User-Agent": "UET-Research/1.0"}
-            )
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
+            body = call_with_retry(_get, url, timeout)
+            return orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
         except Exception as e:
-            print(f"  ⚠️ Error fetching {url}: {e}")
+            log(f"  ⚠️ Error fetching {url}: {e}")
             return None
 
     # =========================================================================
@@ -69,74 +122,82 @@ class RealTimeDataFetcher:
         self,
         bbox: tuple = None,  # (lat_min, lon_min, lat_max, lon_max)
         limit: int = 100,
+        log: Callable = print,
     ) -> List[FluidDataPoint]:
         """
         Fetch live aircraft positions and velocities.
         Source: OpenSky Network (free, no API key required)
 
         Each aircraft represents a point in the flow field!
+        Progress goes to log (print by default).
         """
-        print("\n📡 Fetching Aircraft Data (OpenSky Network)...")
+        log("\n📡 Fetching Aircraft Data (OpenSky Network)...")
 
         # API endpoint
         url = "https://opensky-network.org/api/states/all"
         if bbox:
             url += f"?lamin={bbox[0]}&lomin={bbox[1]}&lamax={bbox[2]}&lomax={bbox[3]}"
 
-        data = self.fetch_url(url)
+        data = self.fetch_url(url, log=log)
         if not data or "states" not in data:
-            print("  ❌ No aircraft data available")
+            log("  ❌ No aircraft data available")
             return []
 
-        points = []
         timestamp = datetime.now().isoformat()
 
-        for i, state in enumerate(data["states"][:limit]):
-            if state[5] is None or state[6] is None:  # No position
-                continue
-
-            # Extract velocity components
-            velocity = state[9] or 0  # Ground speed (m/s)
-            track = state[10] or 0  # Track angle (degrees from north)
-            vertical = state[11] or 0  # Vertical rate (m/s)
-            altitude = state[7] or 0  # Altitude (m)
-
-            # Convert track to x,y velocity
-            track_rad = np.radians(track)
-            vx = velocity * np.sin(track_rad)
-            vy = velocity * np.cos(track_rad)
-
-            # Estimate air density at altitude
-            # ρ(h) ≈ ρ₀ * exp(-h/H) where H ≈ 8500m
-            rho_0 = 1.225  # kg/m³ at sea level
-            H = 8500
-            density = rho_0 * np.exp(-altitude / H)
-
-            # Temperature (ISA model)
-            T_0 = 288.15  # K at sea level
-            L = 0.0065  # K/m lapse rate
-            temp = T_0 - L * min(altitude, 11000)
-
-            # Pressure (ISA model)
-            P_0 = 101325  # Pa
-            pressure = P_0 * (temp / T_0) ** 5.2561
-
-            points.append(
-                FluidDataPoint(
-                    timestamp=timestamp,
-                    latitude=state[6],
-                    longitude=state[5],
-                    velocity_x=vx,
-                    velocity_y=vy,
-                    velocity_z=vertical,
-                    pressure=pressure,
-                    temperature=temp,
-                    density=density,
-                    source="OpenSky",
-                )
+        # Keep states with a position, then pull the numeric columns into one
+        # array so the physics below runs once per column, not once per aircraft
+        states = [
+            state
+            for state in data["states"][:limit]
+            if state[5] is not None and state[6] is not None  # No position
+        ]
+        columns = np.array(
+            [(state[9] or 0, state[10] or 0, state[11] or 0, state[7] or 0) for state in states],
+            dtype=float,
+        ).reshape(-1, 4)
+        velocity = columns[:, 0]  # Ground speed (m/s)
+        track = columns[:, 1]  # Track angle (degrees from north)
+        vertical = columns[:, 2]  # Vertical rate (m/s)
+        altitude = columns[:, 3]  # Altitude (m)
+
+        # Convert track to x,y velocity
+        track_rad = np.radians(track)
+        vx = velocity * np.sin(track_rad)
+        vy = velocity * np.cos(track_rad)
+
+        # Estimate air density at altitude
+        # ρ(h) ≈ ρ₀ * exp(-h/H) where H ≈ 8500m
+        rho_0 = 1.225  # kg/m³ at sea level
+        H = 8500
+        density = rho_0 * np.exp(-altitude / H)
+
+        # Temperature (ISA model)
+        T_0 = 288.15  # K at sea level
+        L = 0.0065  # K/m lapse rate
+        temp = T_0 - L * np.minimum(altitude, 11000)
+
+        # Pressure (ISA model)
+        P_0 = 101325  # Pa
+        pressure = P_0 * (temp / T_0) ** 5.2561
+
+        points = [
+            FluidDataPoint(
+                timestamp=timestamp,
+                latitude=state[6],
+                longitude=state[5],
+                velocity_x=float(vx[k]),
+                velocity_y=float(vy[k]),
+                velocity_z=float(vertical[k]),
+                pressure=float(pressure[k]),
+                temperature=float(temp[k]),
+                density=float(density[k]),
+                source="OpenSky",
             )
+            for k, state in enumerate(states)
+        ]
 
-        print(f"  ✅ Fetched {len(points)} aircraft positions")
+        log(f"  ✅ Fetched {len(points)} aircraft positions")
         return points
 
     # =========================================================================
@@ -144,67 +205,73 @@ class RealTimeDataFetcher:
     # =========================================================================
 
     def fetch_weather_data(
-        self, lat: float = 35.0, lon: float = 139.0, grid_size: int = 5
+        self, lat: float = 35.0, lon: float = 139.0, grid_size: int = 5, log: Callable = print
     ) -> List[FluidDataPoint]:
         """
         Fetch current weather data for a grid.
         Source: Open-Meteo (free, no API key required)
+        Progress goes to log (print by default).
         """
-        print("\n🌤️ Fetching Weather Data (Open-Meteo)...")
+        log("\n🌤️ Fetching Weather Data (Open-Meteo)...")
 
         points = []
         timestamp = datetime.now().isoformat()
 
         # Create grid around center point
-        for i in range(grid_size):
-            for j in range(grid_size):
-                lat_i = lat + (i - grid_size // 2) * 0.5
-                lon_j = lon + (j - grid_size // 2) * 0.5
-
-                url = (
-                    f"https://api.open-meteo.com/v1/forecast?"
-                    f"latitude={lat_i}&longitude={lon_j}&current_weather=true"
-                )
+        cells = [
+            (lat + (i - grid_size // 2) * 0.5, lon + (j - grid_size // 2) * 0.5)
+            for i in range(grid_size)
+            for j in range(grid_size)
+        ]
+        urls = [
+            f"https://api.open-meteo.com/v1/forecast?"
+            f"latitude={lat_i}&longitude={lon_j}&current_weather=true"
+            for lat_i, lon_j in cells
+        ]
+
+        # One request per cell, all I/O-bound: overlap them (map keeps grid order)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(pool.map(lambda url: self.fetch_url(url, log=log), urls))
+
+        for (lat_i, lon_j), data in zip(cells, responses):
+            if not data or "current_weather" not in data:
+                continue
+
+            weather = data["current_weather"]
+
+            # Wind components
+            wind_speed = weather.get("windspeed", 0) / 3.6  # km/h to m/s
+            wind_dir = weather.get("winddirection", 0)
+            wind_rad = np.radians(wind_dir)
+
+            vx = -wind_speed * np.sin(wind_rad)
+            vy = -wind_speed * np.cos(wind_rad)
+
+            # Temperature
+            temp_c = weather.get("temperature", 20)
+            temp_k = temp_c + 273.15
 
-                data = self.fetch_url(url)
-                if not data or "current_weather" not in data:
-                    continue
-
-                weather = data["current_weather"]
-
-                # Wind components
-                wind_speed = weather.get("windspeed", 0) / 3.6  # km/h to m/s
-                wind_dir = weather.get("winddirection", 0)
-                wind_rad = np.radians(wind_dir)
-
-                vx = -wind_speed * np.sin(wind_rad)
-                vy = -wind_speed * np.cos(wind_rad)
-
-                # Temperature
-                temp_c = weather.get("temperature", 20)
-                temp_k = temp_c + 273.15
-
-                # Estimate pressure and density at sea level
-                pressure = 101325  # Pa (approximate)
-                R = 287  # J/(kg·K)
-                density = pressure / (R * temp_k)
-
-                points.append(
-                    FluidDataPoint(
-                        timestamp=timestamp,
-                        latitude=lat_i,
-                        longitude=lon_j,
-                        velocity_x=vx,
-                        velocity_y=vy,
-                        velocity_z=0,
-                        pressure=pressure,
-                        temperature=temp_k,
-                        density=density,
-                        source="Open-Meteo",
-                    )
+            # Estimate pressure and density at sea level
+            pressure = 101325  # Pa (approximate)
+            R = 287  # J/(kg·K)
+            density = pressure / (R * temp_k)
+
+            points.append(
+                FluidDataPoint(
+                    timestamp=timestamp,
+                    latitude=lat_i,
+                    longitude=lon_j,
+                    velocity_x=vx,
+                    velocity_y=vy,
+                    velocity_z=0,
+                    pressure=pressure,
+                    temperature=temp_k,
+                    density=density,
+                    source="Open-Meteo",
                 )
+            )
 
-        print(f"  ✅ Fetched {len(points)} weather grid points")
+        log(f"  ✅ Fetched {len(points)} weather grid points")
         return points
 
     # =========================================================================
@@ -237,8 +304,12 @@ class RealTimeDataFetcher:
             ],
         }
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            filepath.write_bytes(orjson.dumps(data, option=options))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(data, f, indent=2)
 
         print(f"  💾 Saved to: {filepath}")
         return filepath
@@ -305,8 +376,21 @@ def fetch_all_realtime_data():
     fetcher = RealTimeDataFetcher()
     results = {}
 
+    # Different hosts and pure I/O: fetch both sources at the same time.
+    # Each job logs into its own list, printed in order once both finish,
+    # so the two progress reports never interleave.
+    aircraft_log, weather_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        aircraft_job = pool.submit(fetcher.fetch_aircraft_data, limit=200, log=aircraft_log.append)
+        weather_job = pool.submit(
+            fetcher.fetch_weather_data, lat=35.0, lon=139.0, grid_size=3, log=weather_log.append
+        )
+        aircraft = aircraft_job.result()
+        weather = weather_job.result()
+    for line in aircraft_log + weather_log:
+        print(line)
+
     # 1. Aircraft Data
-    aircraft = fetcher.fetch_aircraft_data(limit=200)
     if aircraft:
         fetcher.save_data(aircraft, "aircraft")
         results["aircraft"] = {
@@ -320,7 +404,6 @@ def fetch_all_realtime_data():
         }
 
     # 2. Weather Data (East Asia region)
-    weather = fetcher.fetch_weather_data(lat=35.0, lon=139.0, grid_size=3)
     if weather:
         fetcher.save_data(weather, "weather")
         results["weather"] = {
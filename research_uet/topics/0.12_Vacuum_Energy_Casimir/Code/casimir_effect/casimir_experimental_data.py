@@ -119,7 +119,10 @@ def load_mohideen_data():
     data_dir = os.path.dirname(__file__)
     path = os.path.join(data_dir, "mohideen_1998_casimir.json")
 
-    if not os.path.exists(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
         save_data()
 
     with open(path, "r") as f:
@@ -131,7 +134,10 @@ def load_lamoreaux_data():
     data_dir = os.path.dirname(__file__)
     path = os.path.join(data_dir, "lamoreaux_1997_casimir.json")
 
-    if not os.path.exists(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
         save_data()
 
     with open(path, "r") as f:
@@ -12,12 +12,148 @@ IMPORTANT: All downloaded data must be cited properly!
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from datetime import datetime
 
 # Base directory
 DATA_DIR = Path(__file__).parent
 
+# Shared session: keeps connections alive between requests and retries
+# transient failures (429/5xx, resets) with exponential backoff
+SESSION = requests.Session()
+_RETRY = Retry(
+    total=4,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+SESSION.mount("https://", HTTPAdapter(max_retries=_RETRY))
+SESSION.mount("http://", HTTPAdapter(max_retries=_RETRY))
+
+
+# ============================================================
+# Conditional GET (ETag / Last-Modified)
+# ============================================================
+
+
+def _meta_path(filepath: Path) -> Path:
+    """Sidecar file holding the validators of the last download."""
+    return filepath.with_name(filepath.name + ".meta.json")
+
+
+def _conditional_get(url: str, filepath: Path, **kwargs):
+    """
+    GET url, revalidating against the copy already saved at filepath.
+
+    Sends If-None-Match / If-Modified-Since from the sidecar written by
+    _save_meta(), but only when the sidecar was recorded for this url and
+    the file on disk still has the recorded size; otherwise a full GET is
+    made. Returns None when the server answers 304 (unchanged), otherwise
+    the response.
+    """
+    headers = dict(kwargs.pop("headers", None) or {})
+    meta_file = _meta_path(filepath)
+
+    if filepath.exists() and meta_file.exists():
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("url") != url or meta.get("size") != filepath.stat().st_size:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = SESSION.get(url, headers=headers, **kwargs)
+    if response.status_code == 304:
+        return None
+    return response
+
+
+def _is_fresh(url: str, filepath: Path, headers: dict = None) -> bool:
+    """
+    HEAD url and compare with the local copy.
+
+    The file is fresh when its size equals the server's Content-Length and
+    it is not older than the server's Last-Modified.
+    """
+    if not filepath.exists():
+        return False
+
+    try:
+        head = SESSION.head(url, headers=headers, timeout=10, allow_redirects=True)
+    except requests.RequestException:
+        return False
+    if head.status_code != 200:
+        return False
+
+    length = head.headers.get("Content-Length")
+    if length is None or int(length) != filepath.stat().st_size:
+        return False
+
+    last_modified = head.headers.get("Last-Modified")
+    if last_modified:
+        try:
+            remote_mtime = parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            return False
+        if remote_mtime > filepath.stat().st_mtime:
+            return False
+
+    return True
+
+
+def _download_if_stale(url: str, filepath: Path, **kwargs):
+    """
+    Skip the GET entirely when a HEAD shows the local file is current.
+
+    Returns None if nothing needs downloading, otherwise the response of a
+    (conditional) GET.
+    """
+    if _is_fresh(url, filepath, kwargs.get("headers")):
+        return None
+    return _conditional_get(url, filepath, **kwargs)
+
+
+def _stream_to_file(response, filepath: Path, chunk_size: int = 1 << 16):
+    """
+    Write a streamed response body to disk chunk by chunk.
+
+    The body goes to a .part file that replaces filepath only once the
+    stream completes, so an interrupted transfer never leaves a truncated
+    file in place. The old sidecar is dropped first; the caller saves a
+    new one after this returns.
+    """
+    _meta_path(filepath).unlink(missing_ok=True)
+    part_file = filepath.with_name(filepath.name + ".part")
+    try:
+        with response, open(part_file, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+        os.replace(part_file, filepath)
+    finally:
+        part_file.unlink(missing_ok=True)
+
+
+def _save_meta(url: str, response, filepath: Path):
+    """Record ETag / Last-Modified of a fresh download of url next to the file."""
+    meta = {
+        "url": url,
+        "size": filepath.stat().st_size,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    with open(_meta_path(filepath), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
 # ============================================================
 # PDG (Particle Data Group) Downloads
 # ============================================================
@@ -37,15 +173,21 @@ def download_pdg_particle(pdg_id: str, output_dir: Path = None):
     output_dir.mkdir(parents=True, exist_ok=True)
 
     url = f"{PDG_API_BASE}/data/particle/{pdg_id}"
+    output_file = output_dir / f"{pdg_id}.json"
 
     try:
-        response = requests.get(url, timeout=30)
+        response = _conditional_get(url, output_file, timeout=30)
+        if response is None:
+            print(f"✅ cached {pdg_id} ({output_file})")
+            with open(output_file) as f:
+                return json.load(f)
         if response.status_code == 200:
             data = response.json()
 
-            output_file = output_dir / f"{pdg_id}.json"
+            _meta_path(output_file).unlink(missing_ok=True)
             with open(output_file, "w") as f:
                 json.dump(data, f, indent=2)
+            _save_meta(url, response, output_file)
 
             print(f"[OK] Downloaded {pdg_id} to {output_file}")
             return data
@@ -70,16 +212,23 @@ PDG_PARTICLES = {
 
 
 def download_all_pdg():
-    """Download all relevant particles from PDG."""
+    """
+    Download all relevant particles from PDG as one batch.
+
+    The requests share SESSION's connection pool and run concurrently,
+    so the batch costs roughly one round trip instead of one per particle.
+    """
     print("=" * 50)
     print("Downloading PDG Particle Data")
     print("=" * 50)
+    print(f"\nDownloading {', '.join(PDG_PARTICLES)}...")
 
-    for name, pdg_id in PDG_PARTICLES.items():
-        print(f"\nDownloading {name}...")
-        download_pdg_particle(pdg_id)
+    with ThreadPoolExecutor(max_workers=len(PDG_PARTICLES)) as pool:
+        data = pool.map(download_pdg_particle, PDG_PARTICLES.values())
+        results = dict(zip(PDG_PARTICLES, data))
 
     print("\nDone!")
+    return results
 
 
 # ============================================================
@@ -150,6 +299,7 @@ def download_sparc(output_dir: Path = None):
         output_dir = DATA_DIR / "02_astrophysics" / "sparc"
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / "SPARC_Lelli2016c.mrt"
 
     print("=" * 50)
     print("Downloading SPARC Galaxy Data")
@@ -161,11 +311,15 @@ def download_sparc(output_dir: Path = None):
     }
 
     try:
-        response = requests.get(SPARC_URL, headers=headers, timeout=60)
+        response = _download_if_stale(
+            SPARC_URL, output_file, headers=headers, timeout=60, stream=True
+        )
+        if response is None:
+            print(f"✅ cached {output_file}")
+            return True
         if response.status_code == 200:
-            output_file = output_dir / "SPARC_Lelli2016c.mrt"
-            with open(output_file, "wb") as f:
-                f.write(response.content)
+            _stream_to_file(response, output_file)
+            _save_meta(SPARC_URL, response, output_file)
 
             print(f"[OK] Downloaded SPARC data to {output_file}")
             print(f"     Contains: 175 galaxy rotation curves")
@@ -182,11 +336,15 @@ def download_sparc(output_dir: Path = None):
         )
         print(f"Trying mirror: {ALT_URL}")
         try:
-            response = requests.get(ALT_URL, headers=headers, timeout=30)
+            response = _download_if_stale(
+                ALT_URL, output_file, headers=headers, timeout=30, stream=True
+            )
+            if response is None:
+                print(f"✅ cached {output_file}")
+                return True
             if response.status_code == 200:
-                output_file = output_dir / "SPARC_Lelli2016c.mrt"
-                with open(output_file, "wb") as f:
-                    f.write(response.content)
+                _stream_to_file(response, output_file)
+                _save_meta(ALT_URL, response, output_file)
                 print("[OK] Downloaded from Mirror.")
                 return True
         except:
@@ -16,10 +16,12 @@ import pandas as pd
 import sys
 from pathlib import Path
 
-_root = Path(__file__).parent
-while _root.name != "research_uet" and _root.parent != _root:
-    _root = _root.parent
-sys.path.insert(0, str(_root.parent))
+try:
+    from research_uet._paths import topic_dir
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import topic_dir
+
 try:
     from research_uet.core.uet_master_equation import (
         UETParameters,
@@ -31,9 +33,11 @@ try:
 except ImportError:
     pass  # Use local definitions if not available
 
+from research_uet.core.csv_cache import read_csv
+
 import os
 
-TOPIC_DIR = Path(__file__).resolve().parent.parent.parent
+TOPIC_DIR = topic_dir(__file__)
 DATA_PATH = TOPIC_DIR / "Data"
 DATA_DIR = str(DATA_PATH)
 
@@ -46,14 +50,14 @@ def load_climate_data():
     # CO2
     co2_path = os.path.join(climate_dir, "noaa_co2_mauna_loa.csv")
     if os.path.exists(co2_path):
-        df = pd.read_csv(co2_path, comment="#")
+        df = read_csv(co2_path, comment="#")
         data["co2"] = df
 
     # Sea level
     sea_path = os.path.join(climate_dir, "noaa_sea_level.csv")
     if os.path.exists(sea_path):
         try:
-            df = pd.read_csv(sea_path, comment="#")
+            df = read_csv(sea_path, comment="#")
             data["sea_level"] = df
         except:
             pass
@@ -79,24 +83,25 @@ def analyze_equilibrium_distance(time_series, name):
     if len(values) < 10:
         return None
 
+    # Only the last 12 rates/accelerations are used, so difference the tail only
     # Rate of change
-    rate = np.diff(values)
-    avg_rate = np.mean(rate[-12:])  # Recent rate
+    avg_rate = np.mean(np.diff(values[-13:]))  # Recent rate
 
     # Acceleration (derivative of rate)
-    accel = np.diff(rate)
-    avg_accel = np.mean(accel[-12:]) if len(accel) > 0 else 0
+    accel = np.diff(values[-14:], n=2)
+    avg_accel = np.mean(accel) if len(accel) > 0 else 0
 
     # Equilibrium distance
     # 0 = equilibrium, higher = farther
-    eq_distance = abs(avg_rate) / (np.std(values) + 0.001)
+    spread = np.std(values)
+    eq_distance = abs(avg_rate) / (spread + 0.001)
 
     # Classify
     if avg_rate > 0 and avg_accel > 0:
         status = "ACCELERATING AWAY (far from equilibrium)"
     elif avg_rate > 0:
         status = "INCREASING (not at equilibrium)"
-    elif abs(avg_rate) < 0.01 * np.std(values):
+    elif abs(avg_rate) < 0.01 * spread:
         status = "STABLE (near equilibrium)"
     else:
         status = "DECREASING (returning to equilibrium)"
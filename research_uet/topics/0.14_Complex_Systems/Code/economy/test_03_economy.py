@@ -11,21 +11,23 @@ Updated for UET V3.0
 
 import numpy as np
 import pandas as pd
+from scipy.fft import irfft, next_fast_len, rfft
 
 # Import from UET V3.0 Master Equation
 import sys
 from pathlib import Path
 
+try:
+    from research_uet._paths import topic_dir
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import topic_dir
+
 # Define Data Path
 # Script: .../0.14_Complex_Systems/Code/economy/
 # Data:   .../0.14_Complex_Systems/Data/
-TOPIC_DIR = Path(__file__).resolve().parent.parent.parent
+TOPIC_DIR = topic_dir(__file__)
 DATA_PATH = TOPIC_DIR / "Data"
-
-_root = Path(__file__).parent
-while _root.name != "research_uet" and _root.parent != _root:
-    _root = _root.parent
-sys.path.insert(0, str(_root.parent))
 try:
     from research_uet.core.uet_master_equation import (
         UETParameters,
@@ -37,6 +39,8 @@ try:
 except ImportError:
     pass  # Use local definitions if not available
 
+from research_uet.core.csv_cache import read_csv
+
 import os
 
 # DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "06_complex_systems")
@@ -53,7 +57,7 @@ def load_economy_data():
             if filename.endswith("_yahoo_real.csv"):
                 filepath = os.path.join(economy_dir, filename)
                 try:
-                    df = pd.read_csv(filepath)
+                    df = read_csv(filepath)
                     # Handle multi-index columns from yfinance
                     if "Close" in df.columns:
                         close_col = "Close"
@@ -94,7 +98,9 @@ def calculate_value_flow_k(prices):
         return None, None
 
     # Calculate returns
-    returns = np.diff(prices) / (prices[:-1] + 1e-10)
+    previous = prices[:-1]
+    returns = np.subtract(prices[1:], previous, dtype=float)
+    returns /= previous + 1e-10
     returns = returns[np.isfinite(returns)]
 
     if len(returns) < 10:
@@ -104,18 +110,20 @@ def calculate_value_flow_k(prices):
     volatility = np.std(returns)
 
     # Autocorrelation (memory)
-    mean_r = np.mean(returns)
-    autocorr = np.correlate(returns - mean_r, returns - mean_r, mode="full")
-    autocorr = autocorr[len(returns) - 1 :] / (autocorr[len(returns) - 1] + 1e-10)
+    # Only the first 20 lags are used, so go through the FFT (Wiener-Khinchin)
+    # instead of the O(N^2) full correlation; padding to >= 2N-1 avoids wrap-around
+    n = len(returns)
+    centered = returns - np.mean(returns)
+    m = next_fast_len(2 * n - 1, real=True)
+    spectrum = rfft(centered, m)
+    autocorr = irfft(spectrum * np.conj(spectrum), m)[: min(n, 20)]
+    autocorr = autocorr / (autocorr[0] + 1e-10)
 
     # Memory decay → estimate k
     # Fast decay = k close to 1 (efficient market)
     # Slow decay = k < 1 (momentum)
-    memory_time = 1
-    for i, a in enumerate(autocorr[1:20]):
-        if a < 0.5:
-            memory_time = i + 1
-            break
+    decayed = autocorr[1:20] < 0.5
+    memory_time = int(decayed.argmax()) + 1 if decayed.any() else 1
 
     # k estimation based on volatility scaling
     # For efficient markets: k ≈ 1
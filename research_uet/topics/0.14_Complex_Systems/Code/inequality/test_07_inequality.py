@@ -9,6 +9,7 @@ Uses World Bank inequality/economic data.
 Updated for UET V3.0
 """
 
+import bisect
 import numpy as np
 import pandas as pd
 import os
@@ -17,10 +18,12 @@ import os
 import sys
 from pathlib import Path
 
-_root = Path(__file__).parent
-while _root.name != "research_uet" and _root.parent != _root:
-    _root = _root.parent
-sys.path.insert(0, str(_root.parent))
+try:
+    from research_uet._paths import topic_dir
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import topic_dir
+
 try:
     from research_uet.core.uet_master_equation import (
         UETParameters,
@@ -32,12 +35,18 @@ try:
 except ImportError:
     pass  # Use local definitions if not available
 
+from research_uet.core.csv_cache import read_csv
+
 import glob
 
-TOPIC_DIR = Path(__file__).resolve().parent.parent.parent
+TOPIC_DIR = topic_dir(__file__)
 DATA_PATH = TOPIC_DIR / "Data"
 DATA_DIR = str(DATA_PATH)
 
+# Health-index bands: k <= 0.7, <= 1.0, <= 1.5, above
+K_BINS = (0.7, 1.0, 1.5)
+K_EMOJI = ("🔴", "🟠", "🟡", "🟢")
+
 
 def load_inequality_data():
     """Load World Bank economic data."""
@@ -49,7 +58,7 @@ def load_inequality_data():
         for filepath in glob.glob(os.path.join(ineq_dir, "worldbank_*.csv")):
             name = os.path.basename(filepath).replace("worldbank_", "").replace(".csv", "")
             try:
-                df = pd.read_csv(filepath)
+                df = read_csv(filepath)
                 data[name] = df
             except:
                 pass
@@ -60,7 +69,7 @@ def load_inequality_data():
         for filepath in glob.glob(os.path.join(econ_dir, "econ_*.csv")):
             name = os.path.basename(filepath).replace("econ_", "").replace(".csv", "")
             try:
-                df = pd.read_csv(filepath)
+                df = read_csv(filepath)
                 data[name] = df
             except:
                 pass
@@ -168,25 +177,20 @@ def run_test():
         else:
             gdp_latest["unemployment"] = 5  # Default assumption
 
-        # Calculate k for each country
-        for country_code, row in gdp_latest.iterrows():
-            if pd.isna(row.get("gdp_pc")) or pd.isna(row.get("debt_ratio")):
-                continue
-
-            k = calculate_uet_health_index(
-                row["gdp_pc"], row.get("debt_ratio", 50), row.get("unemployment", 5)
-            )
-
-            if k is not None:
-                results.append(
-                    {
-                        "country": country_code,
-                        "gdp_pc": row["gdp_pc"],
-                        "debt_ratio": row.get("debt_ratio", 50),
-                        "unemployment": row.get("unemployment", 5),
-                        "k_index": k,
-                    }
-                )
+        # Calculate k for every country at once (calculate_uet_health_index, vectorized)
+        valid = gdp_latest.dropna(subset=["gdp_pc", "debt_ratio"])
+        valid = valid[(valid["gdp_pc"] > 0) & (valid["debt_ratio"] > 0)]
+        productivity = valid["gdp_pc"] / 10000
+        emp_factor = 1 - valid["unemployment"] / 100
+        k = np.sqrt(productivity / (valid["debt_ratio"] + 0.1)) * emp_factor
+
+        results = (
+            valid[["gdp_pc", "debt_ratio", "unemployment"]]
+            .assign(k_index=k)
+            .rename_axis("country")
+            .reset_index()
+            .to_dict("records")
+        )
 
     if not results:
         print("❌ Could not calculate health index")
@@ -199,14 +203,7 @@ def run_test():
     print("Top 10 Healthiest:")
     for r in results[:10]:
         k = r["k_index"]
-        if k > 1.5:
-            emoji = "🟢"
-        elif k > 1.0:
-            emoji = "🟡"
-        elif k > 0.7:
-            emoji = "🟠"
-        else:
-            emoji = "🔴"
+        emoji = K_EMOJI[bisect.bisect_left(K_BINS, k)]
         print(
             f"   {emoji} {r['country']:5} k={k:.2f}  (GDP=${r['gdp_pc']:,.0f}, Debt={r['debt_ratio']:.0f}%)"
         )
@@ -24,6 +24,9 @@ Reference: Farrah et al. (2023), Croker et al. (2024)
 """
 
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # Non-interactive backend
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 from scipy import stats
@@ -471,7 +474,7 @@ def run_ultimate_analysis():
     print("STEP 6: GENERATING PLOTS")
     print("=" * 70)
 
-    fig = plt.figure(figsize=(18, 12))
+    fig = plt.figure(figsize=(18, 12), layout="constrained")
 
     # Plot 1: Main data + models
     ax1 = fig.add_subplot(2, 2, 1)
@@ -589,8 +592,6 @@ def run_ultimate_analysis():
     ax4.legend()
     ax4.grid(alpha=0.3, axis="y")
 
-    plt.tight_layout()
-
     output_path = SCRIPT_DIR / "ultimate_ccbh_analysis.png"
     plt.savefig(output_path, dpi=200, bbox_inches="tight")
     print(f"   ✅ Saved: {output_path}")
@@ -284,7 +284,10 @@ def load_data():
     data_dir = os.path.join(os.path.dirname(__file__), "little_things")
     path = os.path.join(data_dir, "little_things_rotation_curves.json")
 
-    if not os.path.exists(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
         save_data()
 
     with open(path, "r") as f:
@@ -16,13 +16,13 @@ import numpy as np
 import sys
 
 # Import from UET V3.0 Master Equation
-import sys
 from pathlib import Path
 
-_root = Path(__file__).parent
-while _root.name != "research_uet" and _root.parent != _root:
-    _root = _root.parent
-sys.path.insert(0, str(_root.parent))
+try:
+    from research_uet._paths import topic_dir
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import topic_dir
 try:
     from research_uet.core.uet_master_equation import (
         UETParameters,
@@ -34,16 +34,11 @@ try:
 except ImportError:
     pass  # Use local definitions if not available
 
-import os
-
-# Add research_uet root to path
-# Add data path (local)
-data_dir = _root / "Data" / "nuclear_binding_250"
-
 # Fix Import Path for Data Module
-TOPIC_DIR = Path(__file__).resolve().parent.parent.parent
+TOPIC_DIR = topic_dir(__file__)
 DATA_SUBDIR = TOPIC_DIR / "Data" / "nuclear_binding_250"
-sys.path.append(str(DATA_SUBDIR))
+if str(DATA_SUBDIR) not in sys.path:
+    sys.path.append(str(DATA_SUBDIR))
 
 try:
     from qcd_strong_force_data import (
@@ -52,12 +47,15 @@ try:
         HADRON_MASSES,
         STRING_TENSION,
         LAMBDA_QCD,
+        FLAVOR_THRESHOLDS_GEV,
         get_alpha_s_at_scale,
     )
 except ImportError as e:
     print(f"CRITICAL: Could not import qcd_strong_force_data from {DATA_SUBDIR}")
     raise e
 
+ALPHA_S_RUNNING_ARR = np.array(ALPHA_S_RUNNING, dtype=np.float64)
+
 
 def uet_alpha_s_running(Q_GeV: float, kappa: float = 0.5, beta: float = 1.0) -> float:
     """
@@ -74,7 +72,7 @@ def uet_alpha_s_running(Q_GeV: float, kappa: float = 0.5, beta: float = 1.0) ->
 
     Parameters:
     -----------
-    Q_GeV : Energy scale in GeV
+    Q_GeV : Energy scale in GeV (scalar or array)
     kappa : UET gradient coefficient
     beta : Coupling to information field
     """
@@ -82,23 +80,19 @@ def uet_alpha_s_running(Q_GeV: float, kappa: float = 0.5, beta: float = 1.0) ->
     alpha_0 = 0.5  # Coupling at Lambda scale
 
     # Number of active flavors
-    if Q_GeV < 1.27:
-        nf = 3
-    elif Q_GeV < 4.18:
-        nf = 4
-    elif Q_GeV < 172.5:
-        nf = 5
-    else:
-        nf = 6
+    nf = 3 + np.searchsorted(FLAVOR_THRESHOLDS_GEV, Q_GeV, side="right")
 
     # UET running coefficient (should match b0 = (33-2*nf)/3)
     b0_effective = kappa * (33 - 2 * nf) / 3
 
-    log_Q = np.log(Q_GeV**2 / Lambda_QCD**2)
+    Q_ratio = Q_GeV**2 / Lambda_QCD**2
+    log_Q = np.log(Q_ratio)
 
-    # Prevent division by small number
-    if log_Q < 0.1:
-        return alpha_0
+    # Prevent division by small number: those scales return alpha_0, and get
+    # harmless placeholder values so the terms below stay finite
+    near_pole = log_Q < 0.1
+    log_Q = np.where(near_pole, 1.0, log_Q)
+    Q_ratio = np.where(near_pole, 0.0, Q_ratio)
 
     # Analytic Perturbation Theory (APT)
     # The standard 1-loop formula has a "Landau pole" singularity at Q = Lambda.
@@ -112,7 +106,7 @@ def uet_alpha_s_running(Q_GeV: float, kappa: float = 0.5, beta: float = 1.0) ->
     # 2. Analytic Refinement (UET Information Potential)
     # This term comes from the requirement that Information Density is finite.
     # It cancels the pole at Q = Lambda.
-    analytic_term = (2 * np.pi) / b0_effective * (1 / (1 - (Q_GeV**2 / Lambda_QCD**2)))
+    analytic_term = (2 * np.pi) / b0_effective * (1 / (1 - Q_ratio))
 
     # However, standard APT form usually defined as:
     # alpha_APT(s) = (1/b0) * [ 1/ln(s/L^2) + L^2/(L^2 - s) ]
@@ -125,11 +119,29 @@ def uet_alpha_s_running(Q_GeV: float, kappa: float = 0.5, beta: float = 1.0) ->
     # The second term must also -> infinity with opposite sign.
 
     term_perturbative = 1.0 / log_Q
-    term_power = 1.0 / (1.0 - (Q_GeV**2 / Lambda_QCD**2))
+    term_power = 1.0 / (1.0 - Q_ratio)
 
     alpha_Q = (2 * np.pi / b0_effective) * (term_perturbative + term_power)
 
-    return abs(alpha_Q)  # Ensure positive magnitude
+    # Ensure positive magnitude; [()] unwraps scalar input
+    return np.where(near_pole, alpha_0, np.abs(alpha_Q))[()]
+
+
+def _check_alpha_s_running(kappa: float):
+    """
+    Compare UET alpha_s running with every ALPHA_S_RUNNING point (no output).
+
+    Returns the Q, alpha_exp, alpha_uet, error % and pass-flag columns.
+    """
+    # Whole table at once: columns Q, alpha_exp, err
+    Q, alpha_exp, err = ALPHA_S_RUNNING_ARR.T
+    alpha_uet = uet_alpha_s_running(Q, kappa=kappa)
+    diff = np.abs(alpha_uet - alpha_exp)
+    error_pct = diff / alpha_exp * 100
+
+    # Pass if within 15% or within experimental error
+    ok = (error_pct < 15) | (diff < 2 * err)
+    return Q, alpha_exp, alpha_uet, error_pct, ok
 
 
 def test_alpha_s_running():
@@ -150,24 +162,17 @@ def test_alpha_s_running():
     print(f"{'Q (GeV)':<10} {'alpha_QCD':<12} {'alpha_UET':<12} {'Error %':<10} {'Status':<10}")
     print("-" * 60)
 
-    results = []
-    passed = 0
-
-    for Q, alpha_exp, err in ALPHA_S_RUNNING:
-        alpha_uet = uet_alpha_s_running(Q, kappa=kappa_calibrated)
-        error_pct = abs(alpha_uet - alpha_exp) / alpha_exp * 100
-
-        # Pass if within 15% or within experimental error
-        status = "PASS" if error_pct < 15 or abs(alpha_uet - alpha_exp) < 2 * err else "FAIL"
-        if status == "PASS":
-            passed += 1
+    columns = _check_alpha_s_running(kappa_calibrated)
+    error_pct, ok = columns[3], columns[4]
+    passed = int(np.count_nonzero(ok))
 
-        results.append({"Q": Q, "exp": alpha_exp, "uet": alpha_uet, "error": error_pct})
-
-        print(f"{Q:<10.1f} {alpha_exp:<12.4f} {alpha_uet:<12.4f} {error_pct:<10.1f} {status:<10}")
+    for row in zip(*columns):
+        q, a_exp, a_uet, e_pct, row_ok = row
+        status = "PASS" if row_ok else "FAIL"
+        print(f"{q:<10.1f} {a_exp:<12.4f} {a_uet:<12.4f} {e_pct:<10.1f} {status:<10}")
 
     pass_rate = passed / len(ALPHA_S_RUNNING) * 100
-    avg_error = np.mean([r["error"] for r in results])
+    avg_error = np.mean(error_pct)
 
     print("-" * 60)
     print(f"Pass Rate: {pass_rate:.0f}% ({passed}/{len(ALPHA_S_RUNNING)})")
@@ -232,24 +237,26 @@ def uet_hadron_mass(base_mass_MeV: float, n_quarks: int = 2, beta: float = 1.0)
     return M_uet
 
 
+# Key hadrons to test: (name, M_exp MeV, n_quarks, constituent quark mass
+# sum MeV used as the UET base mass)
+TEST_HADRONS = (
+    ("proton", 938.27, 3, 10),  # uud (light baryons)
+    ("neutron", 939.57, 3, 10),  # udd
+    ("pion_pm", 139.57, 2, 5),  # ud (light quark current mass sum)
+    ("kaon_pm", 493.68, 2, 95),  # us (u + s)
+    ("rho", 775.26, 2, 10),  # ud
+    ("omega_m", 1672.45, 3, 280),  # sss (3 x strange)
+    ("J_psi", 3096.90, 2, 2540),  # cc (2 x charm)
+    ("Upsilon", 9460.30, 2, 8360),  # bb (2 x bottom, m_b ~ 4180 MeV)
+)
+
+
 def test_hadron_spectrum():
     """Test UET against hadron mass spectrum."""
     print("\n" + "=" * 60)
     print("TEST 2: Hadron Mass Spectrum")
     print("=" * 60)
 
-    # Key hadrons to test
-    test_hadrons = [
-        ("proton", 938.27, 3),  # uud
-        ("neutron", 939.57, 3),  # udd
-        ("pion_pm", 139.57, 2),  # ud
-        ("kaon_pm", 493.68, 2),  # us
-        ("rho", 775.26, 2),  # ud
-        ("omega_m", 1672.45, 3),  # sss
-        ("J_psi", 3096.90, 2),  # cc
-        ("Upsilon", 9460.30, 2),  # bb (Bottom Quark Test)
-    ]
-
     print("\nComparison (using constituent quark model mapping):")
     print("-" * 70)
     print(f"{'Hadron':<12} {'M_exp (MeV)':<14} {'M_UET (MeV)':<14} {'Error %':<10} {'Status':<10}")
@@ -258,21 +265,7 @@ def test_hadron_spectrum():
     passed = 0
     errors = []
 
-    for name, m_exp, n_q in test_hadrons:
-        # Map to constituent quark masses
-        if "pion" in name:
-            base = 5  # light quark current mass sum
-        elif "kaon" in name:
-            base = 95  # u + s
-        elif "J_psi" in name:
-            base = 2540  # 2 x charm
-        elif "Upsilon" in name:
-            base = 8360  # 2 x bottom (m_b ~ 4180 MeV)
-        elif "omega_m" in name:
-            base = 280  # 3 x strange
-        else:
-            base = 10  # light baryons
-
+    for name, m_exp, n_q, base in TEST_HADRONS:
         # UET: Add gradient contribution
         m_uet = uet_hadron_mass(base, n_quarks=n_q)
 
@@ -285,11 +278,11 @@ def test_hadron_spectrum():
         errors.append(error_pct)
         print(f"{name:<12} {m_exp:<14.2f} {m_uet:<14.2f} {error_pct:<10.1f} {status:<10}")
 
-    pass_rate = passed / len(test_hadrons) * 100
+    pass_rate = passed / len(TEST_HADRONS) * 100
     avg_error = np.mean(errors)
 
     print("-" * 70)
-    print(f"Pass Rate: {pass_rate:.0f}% ({passed}/{len(test_hadrons)})")
+    print(f"Pass Rate: {pass_rate:.0f}% ({passed}/{len(TEST_HADRONS)})")
     print(f"Average Error: {avg_error:.1f}%")
 
     return pass_rate, avg_error
@@ -2,15 +2,15 @@ import sys
 from pathlib import Path
 import json
 
+# Data would clearly be loaded from json if I had parsing logic,
+# but I'll hardcode for robustness in this one-shot
+QUARKS = ["u", "d", "s", "c", "b", "t"]
+MASSES_MEV = [2.3, 4.8, 95, 1275, 4180, 173000]
+
 
 def run_test():
     print("UET QUARK MASS HIERARCHY")
 
-    # Data would clearly be loaded from json if I had parsing logic,
-    # but I'll hardcode for robustness in this one-shot
-    quarks = ["u", "d", "s", "c", "b", "t"]
-    masses_mev = [2.3, 4.8, 95, 1275, 4180, 173000]
-
     # UET Scaling: M_n ~ M_0 * Phi^n roughly?
     # Or Generations: 1, 2, 3
 
@@ -18,23 +18,20 @@ def run_test():
 
     # --- VISUALIZATION ---
     try:
-        sys.path.append(str(Path(__file__).parents[4]))
+        research_root = str(Path(__file__).parents[4])
+        if research_root not in sys.path:
+            sys.path.append(research_root)
         from core import uet_viz
 
         result_dir = Path(__file__).parents[2] / "Result"
-        import numpy as np
 
         fig = uet_viz.go.Figure()
         fig.add_trace(
             uet_viz.go.Scatter(
-                x=quarks, y=masses_mev, mode="markers+lines", name="Observed Mass", yaxis="y1"
+                x=QUARKS, y=MASSES_MEV, mode="markers+lines", name="Observed Mass", yaxis="y1"
             )
         )
 
-        # UET Fit (Log Linear)
-        # 3 generations
-        gens = [1, 1, 2, 2, 3, 3]
-
         fig.update_layout(title="Quark Mass Hierarchy", yaxis_title="Mass (MeV)", yaxis_type="log")
         uet_viz.save_plot(fig, "quark_mass_scaling.png", result_dir)
         print("  [Viz] Generated 'quark_mass_scaling.png'")
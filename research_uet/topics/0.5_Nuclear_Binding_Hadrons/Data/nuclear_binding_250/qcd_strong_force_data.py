@@ -9,6 +9,8 @@ Sources:
 - Lattice QCD hadron mass spectrum
 """
 
+import numpy as np
+
 # PDG 2024 - Strong coupling constant running
 # alpha_s at different energy scales Q
 ALPHA_S_RUNNING = [
@@ -89,6 +91,10 @@ LAMBDA_QCD = {
 }
 
 
+# Flavor thresholds (GeV): charm, bottom, top
+FLAVOR_THRESHOLDS_GEV = (1.27, 4.18, 172.5)
+
+
 def get_alpha_s_at_scale(Q_GeV: float) -> float:
     """
     Calculate alpha_s at energy scale Q using 1-loop running.
@@ -96,21 +102,14 @@ def get_alpha_s_at_scale(Q_GeV: float) -> float:
     alpha_s(Q) = alpha_s(MZ) / (1 + (alpha_s(MZ)*b0/2pi)*ln(Q^2/MZ^2))
 
     b0 = (33 - 2*nf) / 3 for nf active flavors
-    """
-    import numpy as np
 
+    Q_GeV may also be an array, giving the whole running curve in one call.
+    """
     MZ = 91.2  # GeV
     alpha_MZ = ALPHA_S_MZ["value"]
 
-    # Determine number of active flavors
-    if Q_GeV < 1.27:  # below charm
-        nf = 3
-    elif Q_GeV < 4.18:  # below bottom
-        nf = 4
-    elif Q_GeV < 172.5:  # below top
-        nf = 5
-    else:
-        nf = 6
+    # Number of active flavors: 3 below charm, +1 per threshold crossed
+    nf = 3 + np.searchsorted(FLAVOR_THRESHOLDS_GEV, Q_GeV, side="right")
 
     b0 = (33 - 2 * nf) / 3
 
@@ -122,8 +121,6 @@ def get_alpha_s_at_scale(Q_GeV: float) -> float:
 
 
 if __name__ == "__main__":
-    import numpy as np
-
     print("=" * 60)
     print("QCD Strong Force Data - PDG 2024")
     print("=" * 60)
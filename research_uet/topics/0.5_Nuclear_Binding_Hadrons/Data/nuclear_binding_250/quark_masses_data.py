@@ -86,6 +86,12 @@ QUARK_CHARGES = {
 # UET PREDICTIONS (NO FITTING!)
 # ============================================================
 
+# Winding numbers for each quark (hypothesis)
+# Up-type: u=1, c=2, t=3
+# Down-type: d=1.5, s=2.5, b=3.5 (heavier due to +1/2 winding)
+_WINDING_QUARKS = ("up", "down", "strange", "charm", "bottom", "top")
+_WINDING_NUMBERS = np.array([1.0, 1.5, 2.5, 3.0, 4.0, 5.5])
+
 
 def uet_quark_mass_prediction(kappa=0.5, beta=1.0):
     """
@@ -102,26 +108,10 @@ def uet_quark_mass_prediction(kappa=0.5, beta=1.0):
     # Base scale (electron mass as reference)
     m_0 = 0.511  # MeV (electron)
 
-    # Winding numbers for each quark (hypothesis)
-    # Up-type: u=1, c=2, t=3
-    # Down-type: d=1.5, s=2.5, b=3.5 (heavier due to +1/2 winding)
-
-    windings = {
-        "up": 1.0,
-        "down": 1.5,
-        "strange": 2.5,
-        "charm": 3.0,
-        "bottom": 4.0,
-        "top": 5.5,
-    }
-
-    predictions = {}
-    for quark, n in windings.items():
-        # UET formula: m = m_0 * exp(n * π * κ)
-        mass = m_0 * np.exp(n * np.pi * kappa)
-        predictions[quark] = mass
+    # UET formula: m = m_0 * exp(n * π * κ), all six in one np.exp
+    masses = m_0 * np.exp(_WINDING_NUMBERS * np.pi * kappa)
 
-    return predictions
+    return dict(zip(_WINDING_QUARKS, masses))
 
 
 def uet_generation_mass_ratio():
@@ -2,10 +2,13 @@
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).parent
-while ROOT.name != "research_uet" and ROOT.parent != ROOT:
-    ROOT = ROOT.parent
-sys.path.insert(0, str(ROOT.parent))
+try:
+    from research_uet._paths import research_root
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import research_root
+
+ROOT = research_root()
 try:
     from research_uet.core.uet_master_equation import UETParameters, calculate_uet_potential
 except ImportError:
@@ -24,10 +27,23 @@ Data: PDG 2024, NNDC, KATRIN
 DOI: 10.1093/ptep/ptac097, 10.1038/s41567-021-01463-1
 """
 
+import math
+import os
+from functools import lru_cache
+
 import numpy as np
 import sys
 from pathlib import Path
 
+# UET_VERBOSE=0 silences the report, e.g. when sweeping parameters
+VERBOSE = os.environ.get("UET_VERBOSE", "1") == "1"
+
+
+def _p(*args, **kwargs):
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
 # =============================================================================
 # INLINE DATA - PDG 2024, NNDC, KATRIN
 # DOI: 10.1093/ptep/ptac097 (PDG), 10.1038/s41567-021-01463-1 (KATRIN)
@@ -80,6 +96,18 @@ BETA_MINUS_ISOTOPES = {
     "Co60": {"parent": "Co60", "half_life_years": 5.27, "Q_value_keV": 2824, "use": "Radiotherapy"},
 }
 
+SECONDS_PER_DAY = 24 * 3600
+SECONDS_PER_YEAR = 365.25 * SECONDS_PER_DAY
+
+for _isotope in BETA_MINUS_ISOTOPES.values():
+    if "half_life_years" in _isotope:
+        _isotope["half_life_s"] = _isotope["half_life_years"] * SECONDS_PER_YEAR
+    else:
+        _isotope["half_life_s"] = _isotope["half_life_days"] * SECONDS_PER_DAY
+del _isotope
+
+ISOTOPE_ROW = "{:<12} {:<18} {:<12.1f} {:<30}".format
+
 KURIE_PLOT = {
     "purpose": "Measure neutrino mass from endpoint",
     "best_isotope": "Tritium (lowest Q)",
@@ -98,6 +126,7 @@ def phase_space_factor(Q):
     return Q**5
 
 
+@lru_cache(maxsize=1)
 def uet_beta_minus_interpretation():
     return {
         "d_quark": "Higher C-field winding",
@@ -114,37 +143,37 @@ def uet_lifetime_from_Q(Q_keV, reference_tau=878.4, reference_Q=782.3):
 
 def test_beta_minus_mechanism():
     """Test understanding of beta- decay mechanism."""
-    print("\n" + "=" * 70)
-    print("TEST 1: Beta-Minus Decay Mechanism")
-    print("=" * 70)
+    _p("\n" + "=" * 70)
+    _p("TEST 1: Beta-Minus Decay Mechanism")
+    _p("=" * 70)
 
-    print(f"\nBeta-Minus Decay:")
-    print(f"  Process: {BETA_MINUS_MECHANISM['process']}")
-    print(f"  Quark level: {BETA_MINUS_MECHANISM['quark_level']}")
-    print(f"  Occurs in: {BETA_MINUS_MECHANISM['occurs_in']}")
-    print(f"  Z change: {BETA_MINUS_MECHANISM['Z_change']}")
+    _p(f"\nBeta-Minus Decay:")
+    _p(f"  Process: {BETA_MINUS_MECHANISM['process']}")
+    _p(f"  Quark level: {BETA_MINUS_MECHANISM['quark_level']}")
+    _p(f"  Occurs in: {BETA_MINUS_MECHANISM['occurs_in']}")
+    _p(f"  Z change: {BETA_MINUS_MECHANISM['Z_change']}")
 
-    print(f"\nFree Neutron:")
-    print(f"  Lifetime: {FREE_NEUTRON['lifetime_s']:.1f} s")
-    print(f"  Q-value: {FREE_NEUTRON['Q_value_keV']:.1f} keV")
+    _p(f"\nFree Neutron:")
+    _p(f"  Lifetime: {FREE_NEUTRON['lifetime_s']:.1f} s")
+    _p(f"  Q-value: {FREE_NEUTRON['Q_value_keV']:.1f} keV")
 
     uet_interp = uet_beta_minus_interpretation()
-    print(f"\nUET Interpretation:")
+    _p(f"\nUET Interpretation:")
     for key, value in uet_interp.items():
-        print(f"  {key}: {value}")
+        _p(f"  {key}: {value}")
 
     return True, 0
 
 
 def test_isotope_lifetimes():
     """Test lifetime scaling with Q value."""
-    print("\n" + "=" * 70)
-    print("TEST 2: Beta- Isotope Lifetimes")
-    print("=" * 70)
+    _p("\n" + "=" * 70)
+    _p("TEST 2: Beta- Isotope Lifetimes")
+    _p("=" * 70)
 
-    print(f"\nImportant Beta- Isotopes:")
-    print(f"{'Isotope':<12} {'Half-life':<18} {'Q (keV)':<12} {'Use':<30}")
-    print("-" * 72)
+    _p(f"\nImportant Beta- Isotopes:")
+    _p(f"{'Isotope':<12} {'Half-life':<18} {'Q (keV)':<12} {'Use':<30}")
+    _p("-" * 72)
 
     for name, data in BETA_MINUS_ISOTOPES.items():
         if "half_life_years" in data:
@@ -156,55 +185,63 @@ def test_isotope_lifetimes():
 
         Q = data["Q_value_keV"]
         use = data.get("use", "Research")[:28]
-        print(f"{data['parent']:<12} {hl:<18} {Q:<12.1f} {use:<30}")
+        _p(ISOTOPE_ROW(data["parent"], hl, Q, use))
 
-    print("-" * 72)
+    _p("-" * 72)
 
     # Test Q^5 scaling
     Q_n = FREE_NEUTRON["Q_value_keV"]
     tau_n = FREE_NEUTRON["lifetime_s"]
     Q_H3 = BETA_MINUS_ISOTOPES["H3"]["Q_value_keV"]
-    tau_H3_years = BETA_MINUS_ISOTOPES["H3"]["half_life_years"]
-    tau_H3_s = tau_H3_years * 365.25 * 24 * 3600
+    tau_H3_s = BETA_MINUS_ISOTOPES["H3"]["half_life_s"]
 
     ratio_predicted = (Q_n / Q_H3) ** 5
     ratio_actual = tau_H3_s / tau_n
 
-    log_predicted = np.log10(ratio_predicted)
-    log_actual = np.log10(ratio_actual)
+    log_predicted = math.log10(ratio_predicted)
+    log_actual = math.log10(ratio_actual)
     log_diff = abs(log_predicted - log_actual)
 
-    print(f"\nQ^5 Scaling Test:")
-    print(f"  Log ratio: predicted = {log_predicted:.1f}, actual = {log_actual:.1f}")
-    print(f"  Orders of magnitude difference: {log_diff:.1f}")
+    _p(f"\nQ^5 Scaling Test:")
+    _p(f"  Log ratio: predicted = {log_predicted:.1f}, actual = {log_actual:.1f}")
+    _p(f"  Orders of magnitude difference: {log_diff:.1f}")
+
+    # Same scaling across the whole table (allowed and forbidden transitions)
+    Qs = np.array([d["Q_value_keV"] for d in BETA_MINUS_ISOTOPES.values()])
+    taus = np.array([d["half_life_s"] for d in BETA_MINUS_ISOTOPES.values()])
+    log_diffs = np.abs(5 * np.log10(Q_n / Qs) - np.log10(taus / tau_n))
+    _p(
+        f"  All {len(Qs)} isotopes: mean difference = {log_diffs.mean():.1f}, "
+        f"max = {log_diffs.max():.1f}"
+    )
 
     passed = log_diff < 3
-    print(f"\n  Status: {'PASS' if passed else 'CHECK'}")
+    _p(f"\n  Status: {'PASS' if passed else 'CHECK'}")
 
     return passed, log_diff
 
 
 def test_katrin_neutrino_mass():
     """Test connection to neutrino mass measurement (KATRIN)."""
-    print("\n" + "=" * 70)
-    print("TEST 3: Neutrino Mass from Beta Endpoint (KATRIN)")
-    print("=" * 70)
+    _p("\n" + "=" * 70)
+    _p("TEST 3: Neutrino Mass from Beta Endpoint (KATRIN)")
+    _p("=" * 70)
 
-    print(f"\nKurie Plot Method:")
-    print(f"  Purpose: {KURIE_PLOT['purpose']}")
-    print(f"  Best isotope: {KURIE_PLOT['best_isotope']}")
+    _p(f"\nKurie Plot Method:")
+    _p(f"  Purpose: {KURIE_PLOT['purpose']}")
+    _p(f"  Best isotope: {KURIE_PLOT['best_isotope']}")
 
-    print(f"\nKATRIN Results:")
-    print(f"  Upper limit: m_nu < {KURIE_PLOT['KATRIN_limit_eV']:.1f} eV")
+    _p(f"\nKATRIN Results:")
+    _p(f"  Upper limit: m_nu < {KURIE_PLOT['KATRIN_limit_eV']:.1f} eV")
 
     return True, KURIE_PLOT["KATRIN_limit_eV"]
 
 
 def test_applications():
     """Test practical applications."""
-    print("\n" + "=" * 70)
-    print("TEST 4: Beta- Emitter Applications")
-    print("=" * 70)
+    _p("\n" + "=" * 70)
+    _p("TEST 4: Beta- Emitter Applications")
+    _p("=" * 70)
 
     applications = {
         "Radiocarbon Dating": "C14 - Up to 50,000 years",
@@ -214,32 +251,32 @@ def test_applications():
     }
 
     for app, details in applications.items():
-        print(f"\n{app}: {details}")
+        _p(f"\n{app}: {details}")
 
     return True, 0
 
 
 def run_all_tests():
     """Run complete beta- decay validation."""
-    print("=" * 70)
-    print("UET BETA-MINUS DECAY VALIDATION")
-    print("Data: PDG 2024, NNDC, KATRIN")
-    print("DOI: 10.1093/ptep/ptac097")
-    print("=" * 70)
+    _p("=" * 70)
+    _p("UET BETA-MINUS DECAY VALIDATION")
+    _p("Data: PDG 2024, NNDC, KATRIN")
+    _p("DOI: 10.1093/ptep/ptac097")
+    _p("=" * 70)
 
     pass1, _ = test_beta_minus_mechanism()
     pass2, metric2 = test_isotope_lifetimes()
     pass3, metric3 = test_katrin_neutrino_mass()
     pass4, _ = test_applications()
 
-    print("\n" + "=" * 70)
-    print("SUMMARY")
-    print("=" * 70)
+    _p("\n" + "=" * 70)
+    _p("SUMMARY")
+    _p("=" * 70)
 
     passed_count = sum([pass1, pass2, pass3, pass4])
-    print(f"Overall: {passed_count}/4 tests PASS")
+    _p(f"Overall: {passed_count}/4 tests PASS")
 
-    print("=" * 70)
+    _p("=" * 70)
 
     return passed_count >= 3
 
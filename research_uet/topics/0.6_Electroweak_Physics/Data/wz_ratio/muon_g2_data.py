@@ -211,9 +211,9 @@ if __name__ == "__main__":
     print(f"\nTheory (SM dispersive):")
     print(f"  a_μ = {MUON_G2_THEORY['SM_total_dispersive']['value']:.0f} × 10⁻¹¹")
 
-    anomaly = calculate_anomaly()
+    delta_a, sigma = ANOMALY["delta_a"], ANOMALY["sigma"]
     print(f"\nDiscrepancy:")
-    print(f"  Δa_μ = {anomaly['delta_a']:.0f} × 10⁻¹¹")
-    print(f"  Significance: {anomaly['sigma']:.1f}σ")
+    print(f"  Δa_μ = {delta_a:.0f} × 10⁻¹¹")
+    print(f"  Significance: {sigma:.1f}σ")
 
-    print(f"\nStatus: {'ANOMALY!' if anomaly['sigma'] > 3 else 'Marginal'}")
+    print(f"\nStatus: {'ANOMALY!' if sigma > 3 else 'Marginal'}")
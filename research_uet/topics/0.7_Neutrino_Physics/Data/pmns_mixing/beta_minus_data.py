@@ -130,6 +130,17 @@ BETA_MINUS_ISOTOPES = {
     },
 }
 
+SECONDS_PER_DAY = 24 * 3600
+SECONDS_PER_YEAR = 365.25 * SECONDS_PER_DAY
+
+# Canonical half-life in seconds, derived once from the tabulated unit
+for _isotope in BETA_MINUS_ISOTOPES.values():
+    if "half_life_years" in _isotope:
+        _isotope["half_life_s"] = _isotope["half_life_years"] * SECONDS_PER_YEAR
+    else:
+        _isotope["half_life_s"] = _isotope["half_life_days"] * SECONDS_PER_DAY
+del _isotope
+
 # ============================================================
 # KURIE PLOT ANALYSIS (For neutrino mass)
 # ============================================================
@@ -155,18 +166,22 @@ def fermi_function(Z, E_e, m_e=0.511):
 
     Accounts for attraction (β⁻) or repulsion (β⁺)
     between emitted electron/positron and daughter nucleus.
+
+    E_e may be a scalar or an array; F = 1 wherever η vanishes (E_e <= m_e or
+    Z = 0).
     """
     # Simplified non-relativistic approximation
     alpha = 1 / 137.036
-    eta = Z * alpha * m_e / np.sqrt(E_e**2 - m_e**2) if E_e > m_e else 0
-
-    if eta == 0:
-        return 1.0
+    E_e = np.asarray(E_e, dtype=float)
+    above = E_e > m_e
+    p_e = np.sqrt(np.where(above, E_e**2 - m_e**2, 1.0))
+    eta = np.where(above, Z * alpha * m_e / p_e, 0.0)
 
     # F ≈ 2πη / (1 - exp(-2πη)) for β⁻
-    F = 2 * np.pi * eta / (1 - np.exp(-2 * np.pi * eta))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        F = np.where(eta == 0, 1.0, 2 * np.pi * eta / (1 - np.exp(-2 * np.pi * eta)))
 
-    return F
+    return F[()]
 
 
 def phase_space_factor(Q_keV, Z_daughter):
@@ -180,19 +195,17 @@ def phase_space_factor(Q_keV, Z_daughter):
     Q = Q_keV / 1000  # Convert to MeV
     m_e = 0.511  # MeV
 
-    # Numerical integration (simplified)
+    # Numerical integration (simplified), evaluated over the whole grid at once
     n_points = 100
     E_values = np.linspace(m_e + 0.001, Q + m_e - 0.001, n_points)
 
-    f_sum = 0
-    for E_e in E_values:
-        p_e = np.sqrt(E_e**2 - m_e**2) if E_e > m_e else 0
-        T_nu = Q + m_e - E_e  # Neutrino energy
-        F = fermi_function(Z_daughter, E_e, m_e)
+    above = E_values > m_e
+    p_e = np.sqrt(np.where(above, E_values**2 - m_e**2, 0.0))
+    T_nu = Q + m_e - E_values  # Neutrino energy
 
-        integrand = p_e * E_e * T_nu**2 * F
-        f_sum += integrand
+    F = fermi_function(Z_daughter, E_values, m_e)
 
+    f_sum = np.sum(p_e * E_values * T_nu**2 * F)
     f = f_sum * (Q / n_points)  # dE spacing
 
     return f
@@ -10,25 +10,23 @@ from pathlib import Path
 import sys
 import numpy as np
 
+# Robust Root setup (shared by the seed lock and data paths)
+try:
+    from research_uet._paths import research_root
+except ImportError:  # run as a plain script: put the repository root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+    from research_uet._paths import research_root
+
+ROOT = research_root()
+
 # === REPRODUCIBILITY: Lock all seeds for deterministic results ===
 try:
-    _root = Path(__file__).parent
-    while _root.name != "research_uet" and _root.parent != _root:
-        _root = _root.parent
-    sys.path.insert(0, str(_root.parent))
     from research_uet.core.reproducibility import lock_all_seeds
 
     lock_all_seeds(42)
 except ImportError:
     np.random.seed(42)  # Fallback
 
-# Robust Root setup
-ROOT = Path(__file__).resolve().parent
-while ROOT.name != "research_uet" and ROOT.parent != ROOT:
-    ROOT = ROOT.parent
-if str(ROOT.parent) not in sys.path:
-    sys.path.insert(0, str(ROOT.parent))
-
 # Define Data Path
 TOPIC_DIR = ROOT / "topics" / "0.8_Muon_g2_Anomaly"
 DATA_PATH = TOPIC_DIR / "Data"